@@ -17,7 +17,7 @@ from typing import Optional
 
 import typer
 from rich.progress import Progress, track
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import Session, sessionmaker
 import pandas as pd
 
@@ -38,6 +38,16 @@ from ..rl.env import TradingEnvironment
 # Create typer app
 app = typer.Typer(help="Don trading framework CLI")
 
+# Indicator columns persisted by the feature command
+FEATURE_COLUMNS = [
+    'sma_20', 'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower', 'obv', 'vwap',
+    'stoch_k', 'stoch_d', 'adx', 'plus_di', 'minus_di'
+]
+
+# Number of feature rows sent per executemany batch
+FEATURE_INSERT_BATCH_SIZE = 5000
+
 @app.command()
 def setup(
     all: bool = typer.Option(
@@ -158,29 +168,19 @@ def feature(
             st.update("Calculating all technical indicators...")
             result = calculator.calculate_all(data)
 
-            # Save results back to database
+            # Save results back to database in batched executemany inserts
             st.update("Saving calculated features...")
-            for timestamp, row in result.iterrows():
-                feature = TechnicalFeatures(
-                    timestamp=pd.Timestamp(timestamp),  # Ensure timestamp is properly converted
-                    symbol=settings.trading_symbol,
-                    sma_20=row['sma_20'] if pd.notna(row['sma_20']) else None,
-                    rsi=row['rsi'] if pd.notna(row['rsi']) else None,
-                    macd=row['macd'] if pd.notna(row['macd']) else None,
-                    macd_signal=row['macd_signal'] if pd.notna(row['macd_signal']) else None,
-                    macd_hist=row['macd_hist'] if pd.notna(row['macd_hist']) else None,
-                    bb_upper=row['bb_upper'] if pd.notna(row['bb_upper']) else None,
-                    bb_middle=row['bb_middle'] if pd.notna(row['bb_middle']) else None,
-                    bb_lower=row['bb_lower'] if pd.notna(row['bb_lower']) else None,
-                    obv=row['obv'] if pd.notna(row['obv']) else None,
-                    vwap=row['vwap'] if pd.notna(row['vwap']) else None,
-                    stoch_k=row['stoch_k'] if pd.notna(row['stoch_k']) else None,
-                    stoch_d=row['stoch_d'] if pd.notna(row['stoch_d']) else None,
-                    adx=row['adx'] if pd.notna(row['adx']) else None,
-                    plus_di=row['plus_di'] if pd.notna(row['plus_di']) else None,
-                    minus_di=row['minus_di'] if pd.notna(row['minus_di']) else None
+            features = result[FEATURE_COLUMNS]
+            features = features.astype(object).where(features.notna(), None)
+            rows = [
+                {'timestamp': pd.Timestamp(timestamp), 'symbol': settings.trading_symbol, **values}
+                for timestamp, values in zip(features.index, features.to_dict('records'))
+            ]
+            for offset in range(0, len(rows), FEATURE_INSERT_BATCH_SIZE):
+                session.execute(
+                    insert(TechnicalFeatures),
+                    rows[offset:offset + FEATURE_INSERT_BATCH_SIZE]
                 )
-                session.add(feature)
             session.commit()
             log_success("All features calculated successfully!")
 
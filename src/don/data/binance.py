@@ -129,7 +129,9 @@ class BinanceDataCollector(DataCollector):
         Returns:
             Pandas Timestamp object
         """
-        return pd.to_datetime(timestamp, unit='ms')
+        # Construct directly: pd.to_datetime's input-type dispatch costs far
+        # more than the conversion itself on the per-message streaming path
+        return pd.Timestamp(timestamp, unit='ms')
 
     def _process_kline(self, kline: List[Any]) -> Dict[str, Any]:
         """Process raw kline data into structured format.
@@ -37,23 +37,19 @@ class MarketMicrostructureFeatures(BaseFeatureCalculator):
         if bids.empty and asks.empty:
             return pd.Series(0.0, index=bids.index.get_level_values(0).unique() if not bids.empty else asks.index.get_level_values(0).unique())
 
-        # Get unique timestamps
-        timestamps = pd.Index(set(bids.index.get_level_values(0).union(asks.index.get_level_values(0))))
-
-        # Initialize result series
-        imbalance = pd.Series(0.0, index=timestamps)
+        # Get unique timestamps, deriving each side's level values only once
+        bid_timestamps = bids.index.get_level_values(0)
+        ask_timestamps = asks.index.get_level_values(0)
+        timestamps = bid_timestamps.unique().union(ask_timestamps.unique())
 
         # Calculate price-weighted volumes for each timestamp
-        for ts in timestamps:
-            ts_bids = bids.loc[ts] if ts in bids.index.get_level_values(0) else pd.DataFrame()
-            ts_asks = asks.loc[ts] if ts in asks.index.get_level_values(0) else pd.DataFrame()
-
-            bid_volume = (ts_bids['price'] * ts_bids['quantity']).sum() if not ts_bids.empty else 0
-            ask_volume = (ts_asks['price'] * ts_asks['quantity']).sum() if not ts_asks.empty else 0
+        bid_volume = (bids['price'] * bids['quantity']).groupby(bid_timestamps).sum()
+        ask_volume = (asks['price'] * asks['quantity']).groupby(ask_timestamps).sum()
+        bid_volume = bid_volume.reindex(timestamps, fill_value=0.0)
+        ask_volume = ask_volume.reindex(timestamps, fill_value=0.0)
 
-            total_volume = bid_volume + ask_volume
-            if total_volume > 0:
-                imbalance[ts] = (bid_volume - ask_volume) / total_volume
+        total_volume = bid_volume + ask_volume
+        imbalance = ((bid_volume - ask_volume) / total_volume).where(total_volume > 0, 0.0)
 
         return imbalance
 
@@ -71,26 +67,17 @@ class MarketMicrostructureFeatures(BaseFeatureCalculator):
                       Positive values indicate more aggressive buying
                       Negative values indicate more aggressive selling
         """
-        # Get unique timestamps
-        timestamps = df.index.get_level_values(0).unique()
-
-        # Initialize result series
-        imbalance = pd.Series(0.0, index=timestamps)
-
-        # Calculate maker/taker volumes for each timestamp
-        for ts in timestamps:
-            ts_data = df.loc[ts]
-
-            # Calculate volumes for this timestamp
-            maker_mask = ts_data['is_buyer_maker']
-            taker_mask = ~ts_data['is_buyer_maker']
-
-            maker_volume = ts_data.loc[maker_mask, 'quantity'].sum() if any(maker_mask) else 0
-            taker_volume = ts_data.loc[taker_mask, 'quantity'].sum() if any(taker_mask) else 0
-
-            total_volume = maker_volume + taker_volume
-            if total_volume > 0:
-                imbalance[ts] = (maker_volume - taker_volume) / total_volume
+        # Sign each trade by aggressor side so that net (maker - taker) and
+        # total volume per timestamp come out of a single grouped sum
+        quantity = df['quantity']
+        signed_quantity = quantity.where(df['is_buyer_maker'].astype(bool), -quantity)
+        volumes = pd.DataFrame({
+            'net': signed_quantity,
+            'total': quantity
+        }).groupby(df.index.get_level_values(0), sort=False).sum()
+
+        total_volume = volumes['total']
+        imbalance = (volumes['net'] / total_volume).where(total_volume > 0, 0.0)
 
         # Apply rolling window
         return imbalance.rolling(window=window, min_periods=1).mean()
@@ -118,8 +105,9 @@ class MarketMicrostructureFeatures(BaseFeatureCalculator):
         if len(unique_prices) < 2:
             return pd.Series(0.0, index=timestamps)
 
-        # Calculate log returns
-        log_returns = np.log(unique_prices / unique_prices.shift(1))
+        # Calculate log returns as differences of log prices (one vectorized
+        # log pass instead of a shifted division followed by a log)
+        log_returns = np.log(unique_prices).diff()
         log_returns = log_returns.fillna(0)  # Fill NaN from first observation
 
         # Calculate rolling standard deviation
@@ -143,33 +131,21 @@ class MarketMicrostructureFeatures(BaseFeatureCalculator):
                 - short_liquidation_volume: Rolling sum of short liquidation volumes
                 - liquidation_imbalance: Normalized difference between long and short volumes
         """
-        # Get unique timestamps
-        timestamps = liquidations.index.get_level_values(0).unique()
-
-        # Initialize result series
-        long_volumes = pd.Series(0.0, index=timestamps)
-        short_volumes = pd.Series(0.0, index=timestamps)
-
-        # Calculate volumes for each timestamp
-        for ts in timestamps:
-            ts_data = liquidations.loc[ts]
-
-            # Sum liquidation volumes by side
-            long_mask = ts_data['side'] == 'long'
-            short_mask = ts_data['side'] == 'short'
-
-            long_volumes[ts] = ts_data.loc[long_mask, 'quantity'].sum() if any(long_mask) else 0
-            short_volumes[ts] = ts_data.loc[short_mask, 'quantity'].sum() if any(short_mask) else 0
+        # Sum liquidation volumes by side for every timestamp in one grouped pass
+        side = liquidations['side']
+        quantity = liquidations['quantity']
+        volumes = pd.DataFrame({
+            'long': quantity.where(side == 'long', 0.0),
+            'short': quantity.where(side == 'short', 0.0)
+        }).groupby(liquidations.index.get_level_values(0), sort=False).sum().astype(float)
 
         # Calculate rolling sums
-        long_rolling = long_volumes.rolling(window=window, min_periods=1).sum()
-        short_rolling = short_volumes.rolling(window=window, min_periods=1).sum()
+        long_rolling = volumes['long'].rolling(window=window, min_periods=1).sum()
+        short_rolling = volumes['short'].rolling(window=window, min_periods=1).sum()
 
         # Calculate imbalance
         total_volume = long_rolling + short_rolling
-        liquidation_imbalance = pd.Series(0.0, index=timestamps)
-        nonzero_mask = total_volume > 0
-        liquidation_imbalance[nonzero_mask] = (long_rolling - short_rolling) / total_volume
+        liquidation_imbalance = ((long_rolling - short_rolling) / total_volume).where(total_volume > 0, 0.0)
 
         return {
             'long_liquidation_volume': long_rolling,
@@ -190,34 +166,36 @@ class MarketMicrostructureFeatures(BaseFeatureCalculator):
         Returns:
             pd.DataFrame: DataFrame with calculated features
         """
-        # Get unique timestamps for result index
+        # Get unique timestamps for result index; features are collected
+        # first and the result frame is built once against this index
         timestamps = df.index.get_level_values(0).unique()
-        result = pd.DataFrame(index=timestamps)
+        features = {}
 
         # Calculate order book imbalance if we have order book data
         if all(col in df.columns for col in ['price', 'quantity', 'side']):
-            bids = df[df['side'] == 'bid'][['price', 'quantity']]
-            asks = df[df['side'] == 'ask'][['price', 'quantity']]
-            result['order_imbalance'] = self._calculate_order_imbalance(bids, asks)
+            # Select rows and columns together so only the two needed columns
+            # are copied (not the full frame first)
+            side = df['side']
+            bids = df.loc[side == 'bid', ['price', 'quantity']]
+            asks = df.loc[side == 'ask', ['price', 'quantity']]
+            features['order_imbalance'] = self._calculate_order_imbalance(bids, asks)
 
         # Calculate trade flow if we have trade data
         if 'is_buyer_maker' in df.columns and 'quantity' in df.columns:
-            result['trade_flow_imbalance'] = self._calculate_trade_flow(df)
+            features['trade_flow_imbalance'] = self._calculate_trade_flow(df)
 
         # Calculate volatility if we have price data
         if 'close' in df.columns:
-            result['realized_volatility'] = self._calculate_realized_volatility(df['close'])
+            features['realized_volatility'] = self._calculate_realized_volatility(df['close'])
 
         # Calculate liquidation features if we have liquidation data
         if 'side' in df.columns and df['side'].isin(['long', 'short']).any():
-            liq_features = self._calculate_liquidation_impact(df)
-            result['long_liquidation_volume'] = liq_features['long_liquidation_volume']
-            result['short_liquidation_volume'] = liq_features['short_liquidation_volume']
-            result['liquidation_imbalance'] = liq_features['liquidation_imbalance']
+            features.update(self._calculate_liquidation_impact(df))
         else:
-            # Add empty liquidation features with proper index
-            result['long_liquidation_volume'] = pd.Series(0.0, index=result.index)
-            result['short_liquidation_volume'] = pd.Series(0.0, index=result.index)
-            result['liquidation_imbalance'] = pd.Series(0.0, index=result.index)
+            # Add empty liquidation features (broadcast over the index)
+            features.update(dict.fromkeys(
+                ['long_liquidation_volume', 'short_liquidation_volume', 'liquidation_imbalance'],
+                0.0
+            ))
 
-        return result
+        return pd.DataFrame(features, index=timestamps)
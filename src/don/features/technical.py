@@ -26,83 +26,86 @@ class TechnicalIndicators(BaseFeatureCalculator):
         Returns:
             DataFrame with additional columns for technical indicators
         """
-        df = data.copy()
+        close = data['close']
+        high = data['high']
+        low = data['low']
+        volume = data['volume']
+        # Bar-to-bar close change shared by RSI and OBV
+        close_diff = close.diff()
+
+        # Collect indicators first and assemble the output frame once,
+        # instead of copying the input and inserting columns one at a time
+        features = {}
 
         # Basic indicators
-        df['sma_20'] = self._calculate_sma(df['close'], window=20)
-        df['rsi'] = self._calculate_rsi(df['close'], period=14)
-        macd_data = self._calculate_macd(df['close'])
-        df['macd'] = macd_data['macd']
-        df['macd_signal'] = macd_data['signal']
-        df['macd_hist'] = macd_data['histogram']
-        bollinger = self._calculate_bollinger_bands(df['close'])
-        df['bb_upper'] = bollinger['upper']
-        df['bb_middle'] = bollinger['middle']
-        df['bb_lower'] = bollinger['lower']
+        sma_20 = self._calculate_sma(close, window=20)
+        features['sma_20'] = sma_20
+        features['rsi'] = self._calculate_rsi(close, period=14, delta=close_diff)
+        macd_data = self._calculate_macd(close)
+        features['macd'] = macd_data['macd']
+        features['macd_signal'] = macd_data['signal']
+        features['macd_hist'] = macd_data['histogram']
+        bollinger = self._calculate_bollinger_bands(close, middle=sma_20)
+        features['bb_upper'] = bollinger['upper']
+        features['bb_middle'] = bollinger['middle']
+        features['bb_lower'] = bollinger['lower']
 
         # Volume indicators
-        df['obv'] = self._calculate_obv(df['close'], df['volume'])
-        df['vwap'] = self._calculate_vwap(df['high'], df['low'], df['close'], df['volume'])
+        features['obv'] = self._calculate_obv(close, volume, delta=close_diff)
+        features['vwap'] = self._calculate_vwap(high, low, close, volume)
 
         # Momentum indicators
-        stoch = self._calculate_stochastic(df['high'], df['low'], df['close'])
-        df['stoch_k'] = stoch['k']
-        df['stoch_d'] = stoch['d']
-        adx_data = self._calculate_adx(df['high'], df['low'], df['close'])
-        df['adx'] = adx_data['adx']
-        df['plus_di'] = adx_data['plus_di']
-        df['minus_di'] = adx_data['minus_di']
-
-        return df
+        stoch = self._calculate_stochastic(high, low, close)
+        features['stoch_k'] = stoch['k']
+        features['stoch_d'] = stoch['d']
+        adx_data = self._calculate_adx(high, low, close)
+        features['adx'] = adx_data['adx']
+        features['plus_di'] = adx_data['plus_di']
+        features['minus_di'] = adx_data['minus_di']
+
+        return pd.concat(
+            [data.drop(columns=list(features), errors='ignore'), pd.DataFrame(features)],
+            axis=1
+        )
 
     def _calculate_sma(self, series: pd.Series, window: int) -> pd.Series:
         """Calculate Simple Moving Average."""
         return series.rolling(window=window).mean()
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index using Wilder's smoothing method."""
+    def _calculate_rsi(self, prices: pd.Series, period: int = 14,
+                       delta: Optional[pd.Series] = None) -> pd.Series:
+        """Calculate Relative Strength Index using Wilder's smoothing method.
+
+        ``delta`` may be passed as a precomputed ``prices.diff()`` to reuse.
+        """
         if len(prices) < period + 1:
             return pd.Series(np.nan, index=prices.index)
 
         # Calculate price changes
-        delta = prices.diff()
-        gains = delta.copy()
-        losses = delta.copy()
+        if delta is None:
+            delta = prices.diff()
 
         # Handle small price changes to avoid numerical instability
         epsilon = 1e-10  # Small threshold for price changes
-        gains = gains.where(gains > epsilon, 0)
-        losses = losses.where(losses < -epsilon, 0)
-        losses = -losses  # Make losses positive
-
-        # Calculate initial averages
-        avg_gain = gains.iloc[1:period+1].mean()
-        avg_loss = losses.iloc[1:period+1].mean()
-
-        # Initialize RSI series with NaN
+        gains = delta.where(delta > epsilon, 0)
+        losses = -delta.where(delta < -epsilon, 0)  # Make losses positive
+
+        # Wilder's smoothing is an exponential average with alpha = 1/period,
+        # seeded with the simple mean of the first `period` changes
+        seeded_gains = gains.iloc[period:].copy()
+        seeded_losses = losses.iloc[period:].copy()
+        seeded_gains.iloc[0] = gains.iloc[1:period+1].mean()
+        seeded_losses.iloc[0] = losses.iloc[1:period+1].mean()
+        avg_gain = seeded_gains.ewm(alpha=1 / period, adjust=False).mean()
+        avg_loss = seeded_losses.ewm(alpha=1 / period, adjust=False).mean()
+
+        smoothed_rsi = 100 - (100 / (1 + avg_gain / avg_loss.where(avg_loss >= epsilon)))
+        smoothed_rsi = smoothed_rsi.where(avg_gain >= epsilon, 0.0)    # All losses, no gains
+        smoothed_rsi = smoothed_rsi.where(avg_loss >= epsilon, 100.0)  # All gains, no losses
+
+        # RSI is undefined until the first full period
         rsi = pd.Series(np.nan, index=prices.index)
-
-        # Calculate initial RSI
-        if avg_loss < epsilon:
-            rsi.iloc[period] = 100  # All gains, no losses
-        elif avg_gain < epsilon:
-            rsi.iloc[period] = 0    # All losses, no gains
-        else:
-            rs = avg_gain / avg_loss
-            rsi.iloc[period] = 100 - (100 / (1 + rs))
-
-        # Calculate RSI for remaining periods using Wilder's smoothing
-        for i in range(period + 1, len(prices)):
-            avg_gain = ((avg_gain * (period - 1)) + gains.iloc[i]) / period
-            avg_loss = ((avg_loss * (period - 1)) + losses.iloc[i]) / period
-
-            if avg_loss < epsilon:
-                rsi.iloc[i] = 100  # All gains, no losses
-            elif avg_gain < epsilon:
-                rsi.iloc[i] = 0    # All losses, no gains
-            else:
-                rs = avg_gain / avg_loss
-                rsi.iloc[i] = 100 - (100 / (1 + rs))
+        rsi.iloc[period:] = smoothed_rsi.to_numpy()
 
         return rsi
 
@@ -124,9 +127,18 @@ class TechnicalIndicators(BaseFeatureCalculator):
 
     def _calculate_bollinger_bands(self, prices: pd.Series,
                                  window: int = 20,
-                                 num_std: float = 2.0) -> dict:
-        """Calculate Bollinger Bands."""
-        middle = self._calculate_sma(prices, window)
+                                 num_std: float = 2.0,
+                                 middle: Optional[pd.Series] = None) -> dict:
+        """Calculate Bollinger Bands.
+
+        Args:
+            prices: Close prices
+            window: Rolling window size
+            num_std: Band width in standard deviations
+            middle: Precomputed SMA of ``prices`` over ``window`` to reuse
+        """
+        if middle is None:
+            middle = self._calculate_sma(prices, window)
         std = prices.rolling(window=window).std()
         upper = middle + (std * num_std)
         lower = middle - (std * num_std)
@@ -136,21 +148,21 @@ class TechnicalIndicators(BaseFeatureCalculator):
             'lower': lower
         }
 
-    def _calculate_obv(self, close: pd.Series, volume: pd.Series) -> pd.Series:
-        """Calculate On-Balance Volume (OBV)."""
-        close_diff = close.diff()
-        obv = pd.Series(index=close.index, dtype=float)
-        obv.iloc[0] = volume.iloc[0]
+    def _calculate_obv(self, close: pd.Series, volume: pd.Series,
+                       delta: Optional[pd.Series] = None) -> pd.Series:
+        """Calculate On-Balance Volume (OBV).
 
-        for i in range(1, len(close)):
-            if close_diff.iloc[i] > 0:
-                obv.iloc[i] = obv.iloc[i-1] + volume.iloc[i]
-            elif close_diff.iloc[i] < 0:
-                obv.iloc[i] = obv.iloc[i-1] - volume.iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i-1]
+        ``delta`` may be passed as a precomputed ``close.diff()`` to reuse.
+        """
+        if delta is None:
+            delta = close.diff()
 
-        return obv
+        # Volume is added on up-closes and subtracted on down-closes; unchanged
+        # (or undefined) closes carry the previous value forward.
+        direction = np.sign(delta).fillna(0)
+        signed_volume = direction * volume
+        signed_volume.iloc[0] = volume.iloc[0]
+        return signed_volume.cumsum().astype(float)
 
     def _calculate_vwap(self, high: pd.Series, low: pd.Series,
                        close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -173,9 +185,9 @@ class TechnicalIndicators(BaseFeatureCalculator):
         lowest_low = low.rolling(window=k_period, min_periods=k_period).min()
         highest_high = high.rolling(window=k_period, min_periods=k_period).max()
 
-        k = pd.Series(np.nan, index=high.index)
-        valid_range = (highest_high - lowest_low) > 0
-        k[valid_range] = 100 * ((close - lowest_low) / (highest_high - lowest_low))[valid_range]
+        # %K is undefined (NaN) where the high-low range is empty
+        price_range = highest_high - lowest_low
+        k = (100 * ((close - lowest_low) / price_range)).where(price_range > 0)
         d = k.rolling(window=d_period, min_periods=d_period).mean()
 
         return {
@@ -190,18 +202,18 @@ class TechnicalIndicators(BaseFeatureCalculator):
             empty = pd.Series(np.nan, index=high.index)
             return {'adx': empty, 'plus_di': empty, 'minus_di': empty}
 
-        # Calculate True Range
+        # Calculate True Range (fmax skips NaN like DataFrame.max(axis=1) but
+        # avoids building a temporary frame)
+        prev_close = close.shift(1)
         high_low = high - low
-        high_close = (high - close.shift(1)).abs()
-        low_close = (low - close.shift(1)).abs()
-        tr = pd.DataFrame({'hl': high_low, 'hc': high_close, 'lc': low_close}).max(axis=1)
+        high_close = (high - prev_close).abs()
+        low_close = (low - prev_close).abs()
+        tr = np.fmax(high_low, np.fmax(high_close, low_close))
         atr = tr.ewm(span=period, min_periods=period).mean()
 
         # Calculate DM
         up_move = high - high.shift(1)
         down_move = low.shift(1) - low
-        plus_dm = pd.Series(0.0, index=high.index, dtype=float)  # Initialize as float
-        minus_dm = pd.Series(0.0, index=high.index, dtype=float)  # Initialize as float
 
         # Use numpy where for vectorized operations
         plus_dm = pd.Series(
@@ -16,6 +16,7 @@ class DiscreteActionSpace:
         """
         self.positions = sorted(positions)
         self._validate_positions()
+        self._positions_array = np.array(self.positions)
 
     def _validate_positions(self):
         """Validate position values are within [-1, 1] range."""
@@ -55,7 +56,7 @@ class DiscreteActionSpace:
             return 0 if position < 0 else 4  # Map to -1.0 or 1.0
         else:
             # For values between thresholds, use closest position
-            distances = np.abs(np.array(self.positions) - position)
+            distances = np.abs(self._positions_array - position)
             return int(np.argmin(distances))
 
 
@@ -21,6 +21,11 @@ class TradingEnvironment(gym.Env):
     3. Environment calculates transaction costs
     4. Environment calculates PnL and reward
     5. Environment updates state and returns next observation
+
+    Observations are written into a single preallocated float32 buffer and
+    returned as a read-only view of it, so each observation is only valid
+    until the next call to ``reset`` or ``step``. Copy it if it needs to be
+    kept (e.g. in a custom replay buffer).
     """
 
     def __init__(self,
@@ -52,6 +57,10 @@ class TradingEnvironment(gym.Env):
             dtype=np.float32
         )
 
+        self._close = self.data['close'].to_numpy(dtype=np.float64)
+        self._features = self.data.to_numpy(dtype=np.float32)
+        self._obs_buf = np.empty((window_size, self._features.shape[1]), dtype=np.float32)
+
         self.reset()
 
     def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
@@ -73,8 +82,8 @@ class TradingEnvironment(gym.Env):
             new_position = float(action)
             new_position = self.action_space_handler.clip_position(new_position)
 
-        price_change = self.data['close'].iloc[self.current_step] / \
-                      self.data['close'].iloc[self.current_step - 1] - 1
+        price = self._close[self.current_step]
+        price_change = price / self._close[self.current_step - 1] - 1
 
         trade_size = abs(new_position - self.position)
         trading_cost = trade_size * self.commission
@@ -85,7 +94,7 @@ class TradingEnvironment(gym.Env):
         if trade_size > 0:
             self.trades.append({
                 'step': self.current_step,
-                'price': self.data['close'].iloc[self.current_step],
+                'price': price,
                 'position': new_position,
                 'pnl': step_pnl
             })
@@ -111,7 +120,10 @@ class TradingEnvironment(gym.Env):
     def _get_observation(self) -> np.ndarray:
         start = self.current_step - self.window_size
         end = self.current_step
-        return self.data.iloc[start:end].values
+        np.copyto(self._obs_buf, self._features[start:end])
+        observation = self._obs_buf.view()
+        observation.flags.writeable = False
+        return observation
 
     def _get_info(self) -> Dict[str, Any]:
         return {
@@ -43,7 +43,11 @@ class SharpeReward(BaseReward):
         """
         self.window = window
         self.risk_free_rate = risk_free_rate
-        self.returns_history = []
+        self._daily_risk_free_rate = risk_free_rate / 252  # Daily adjustment
+        self._annualization = np.sqrt(252)
+        # Fixed-size ring buffer of the most recent returns
+        self._returns = np.zeros(window)
+        self._count = 0
 
     def calculate(self, action: float, position: float,
                  pnl: float, **kwargs) -> float:
@@ -58,20 +62,26 @@ class SharpeReward(BaseReward):
         Returns:
             Sharpe ratio based reward
         """
-        self.returns_history.append(pnl)
-        if len(self.returns_history) < self.window:
+        self._returns[self._count % self.window] = pnl
+        self._count += 1
+        if self._count < self.window:
             return 0.0
 
-        # Keep only last window returns
-        self.returns_history = self.returns_history[-self.window:]
-
-        returns = np.array(self.returns_history)
-        excess_returns = returns - self.risk_free_rate / 252  # Daily adjustment
+        # Buffer holds exactly the last window returns (order is irrelevant)
+        returns = self._returns
 
         if len(returns) < 2:
             return 0.0
 
-        sharpe = np.sqrt(252) * (np.mean(excess_returns) / np.std(excess_returns))
+        # Single moment pass: the mean is computed once and reused for the
+        # deviations (std is shift-invariant, so the risk-free adjustment
+        # only affects the mean)
+        mean = returns.mean()
+        deviations = returns - mean
+        std = np.sqrt(deviations.dot(deviations) / len(returns))
+        excess_mean = mean - self._daily_risk_free_rate
+
+        sharpe = self._annualization * (excess_mean / std)
         return sharpe
 
 
@@ -105,3 +105,12 @@ def test_vwap_calculation(sample_data):
     typical_price = (sample_data['high'] + sample_data['low'] + sample_data['close']) / 3
     expected_vwap = (typical_price * sample_data['volume']).cumsum() / sample_data['volume'].cumsum()
     np.testing.assert_array_almost_equal(vwap, expected_vwap)
+
+def test_obv_flat_and_missing_closes():
+    indicators = TechnicalIndicators()
+    close = pd.Series([10.0, 11.0, 11.0, 10.0, np.nan, 12.0])
+    volume = pd.Series([5.0, 2.0, 3.0, 4.0, 1.0, 6.0])
+
+    obv = indicators._calculate_obv(close, volume)
+
+    np.testing.assert_array_almost_equal(obv, [5.0, 7.0, 7.0, 3.0, 3.0, 3.0])
@@ -111,3 +111,17 @@ def test_custom_reward_integration(mock_market_data):
     env.reset()
     _, reward, _, _, _ = env.step(2)
     assert isinstance(reward, float)
+
+def test_observation_buffer_reuse(discrete_env):
+    observation, _ = discrete_env.reset()
+    assert observation.dtype == np.float32
+    assert not observation.flags.writeable
+    np.testing.assert_array_almost_equal(
+        observation, discrete_env.data.iloc[0:10].values, decimal=3
+    )
+
+    next_observation, _, _, _, _ = discrete_env.step(2)
+    assert np.shares_memory(observation, next_observation)
+    np.testing.assert_array_almost_equal(
+        next_observation, discrete_env.data.iloc[1:11].values, decimal=3
+    )
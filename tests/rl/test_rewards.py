@@ -63,3 +63,14 @@ def test_risk_adjusted_reward():
     assert reward.calculate(1.0, 1.0, 0.1) == -0.1
 
     assert reward.calculate(1.0, 1.0, -0.1) == -0.3
+
+def test_sharpe_reward_rolling_window():
+    reward = SharpeReward(window=3, risk_free_rate=0.0)
+    history = [0.3, -0.2, 0.1, 0.2, -0.1]
+
+    for ret in history:
+        result = reward.calculate(0.5, 1.0, ret)
+
+    window = np.array(history[-3:])
+    expected = np.sqrt(252) * window.mean() / window.std()
+    assert result == pytest.approx(expected)